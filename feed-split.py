@@ -13,16 +13,69 @@ import urllib.parse
 import shutil
 import os
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup; stdlib json works too
+    orjson = None
+
 encoding = tiktoken.encoding_for_model("gpt-4o-mini")
 note_pattern = re.compile(r"{%\s*include.*?%}", flags=re.DOTALL)
 highlight_pattern = re.compile(r"{%\s*.*?\s%}", flags=re.DOTALL)
+# Compiled once - these run for every paragraph of every document.
+highlight_lang_pattern = re.compile(r"{%\s*highlight\s*(\w+)\s%}")
+highlight_xml_pattern = re.compile(
+    r"{%\s*highlight xml\s*%}(.*?){%\s*endhighlight\s*%}", flags=re.DOTALL
+)
+function_signature_pattern = re.compile(r"^[a-z_]+\s*\(.*")
+function_name_pattern = re.compile(r"^([a-z_]+)\(*")
+multi_newline_pattern = re.compile(r"\n{2,}")
+fence_open_pattern = re.compile(r"\n*```")
+fence_close_pattern = re.compile(r"```\n*")
+mathjax_pattern = re.compile(r"window.MathJax = {.*}")
+copyright_pattern = re.compile(r"© Copyright Copyright Vespa.ai.*?\);", flags=re.DOTALL)
+notebook_cell_pattern = re.compile(
+    r"^\s*```\s*\n\s*\[\d{1,3}\]:\s*\n\s*```\s*$", flags=re.MULTILINE
+)
+integer_sequence_pattern = re.compile(r"((?:-?\d+\s*,\s*){10,})-?\d+(?:\s*,\s*-?\d+)*")
+# The code-fence fixups are literal string substitutions; fuse them into one
+# regex so each paragraph is scanned once instead of once per replacement.
+fence_replacements = {
+    "```\njson": "```json",
+    "```\nxml": "```xml",
+    "```\nbash": "```bash",
+    "```\nsh": "```sh",
+    "```\nraw": "```\n",
+    "```\njava": "```java\n",
+    "\n```\n[ ]:\n```": "\n",
+    "\n```\n[1]:\n```": "\n",
+}
+fence_replacement_pattern = re.compile(
+    "|".join(re.escape(k) for k in fence_replacements)
+)
 
 WRITE_MARKDOWN = True  # Set to True to write content to markdown files for debugging
 MARKDOWN_DIR = "markdown_after"  # Directory to write markdown files to
 
 
+def load_json(path):
+    if orjson is not None:
+        with open(path, "rb") as fp:
+            return orjson.loads(fp.read())
+    with open(path) as fp:
+        return json.load(fp)
+
+
+def dump_json(obj, path):
+    if orjson is not None:
+        with open(path, "wb") as fp:
+            fp.write(orjson.dumps(obj))
+    else:
+        with open(path, "w") as fp:
+            json.dump(obj, fp)
+
+
 def what_language(el):
-    z = re.match(r"{%\s*highlight\s*(\w+)\s%}", el.text)
+    z = highlight_lang_pattern.match(el.text)
     if z:
         lang = z.group(1)
         return lang
@@ -40,8 +93,7 @@ def remove_jekyll(text):
 
 
 def xml_fixup(text):
-    regex = r"{%\s*highlight xml\s*%}(.*?){%\s*endhighlight\s*%}"
-    matches = re.findall(regex, text, re.DOTALL)
+    matches = highlight_xml_pattern.findall(text)
     for match in matches:
         escaped_match = escape(match)
         text = text.replace(match, escaped_match)
@@ -90,19 +142,15 @@ def is_function_signature(line: str) -> bool:
     # Exclude __init__-functions, as these belong with their class.
     if line.startswith("__init__"):
         return False
-    # Updated regex pattern to match function signatures in the given HTML
-    pattern = r"^[a-z_]+\s*\(.*"
-    # Check if the line matches the pattern
-    match = re.match(pattern, line)
+    # Check if the line matches the function signature pattern
+    match = function_signature_pattern.match(line)
     return bool(match)
 
 
 def extract_function_name(line: str) -> str:
     line = line.replace("\\", "")
-    # Regex pattern to capture the part before the "("
-    pattern = r"^([a-z_]+)\(*"
-    # Search for the pattern in the line
-    match = re.search(pattern, line)
+    # Search for the function name (the part before the "(") in the line
+    match = function_name_pattern.search(line)
     # If there's a match, return the captured group (function name)
     if match:
         return match.group(1)
@@ -250,8 +298,7 @@ def move_linkable_item_to_single_entity(soup, item):
 
 def remove_notebook_cells(text):
     """Remove pattern matching notebook cells from text. Example: ```\n[1]:\n```"""
-    pattern = r"^\s*```\s*\n\s*\[\d{1,3}\]:\s*\n\s*```\s*$"
-    return re.sub(pattern, "", text, flags=re.MULTILINE)
+    return notebook_cell_pattern.sub("", text)
 
 
 def replace_long_integer_sequences(text):
@@ -264,70 +311,59 @@ def replace_long_integer_sequences(text):
         numbers = match.group(0).split(",")
         return ",".join(numbers[:10]) + ",..."
 
-    pattern = r"((?:-?\d+\s*,\s*){10,})-?\d+(?:\s*,\s*-?\d+)*"
-    return re.sub(pattern, replace_func, text)
+    return integer_sequence_pattern.sub(replace_func, text)
 
 
 def main():
-    with open(sys.argv[1]) as fp:
-        random.seed(42)
-        docs = json.load(fp)
-        operations = []
-        for doc in docs:
-            html_doc = doc["fields"]["html"]
-            html_doc = xml_fixup(html_doc)
-            soup = BeautifulSoup(html_doc, "html5lib")
-            remove_notext_tags(soup)
-            data = split_text(soup, doc["fields"]["path"])
-            for paragraph_id, header, paragraph in data:
-                paragraph = paragraph.lstrip("\n").lstrip(" ")
-                paragraph = paragraph.rstrip("\n")
-
-                paragraph = re.sub(r"\n{2,}", "\n\n", paragraph)
-
-                paragraph = re.sub(r"\n*```", "\n```", paragraph)
-                paragraph = re.sub(r"```\n*", "```\n", paragraph)
-                paragraph = re.sub(r"window.MathJax = {.*}", "", paragraph)
-                paragraph = re.sub(
-                    r"© Copyright Copyright Vespa.ai.*?\);",
-                    "",
-                    paragraph,
-                    flags=re.DOTALL,
+    random.seed(42)
+    docs = load_json(sys.argv[1])
+    operations = []
+    for doc in docs:
+        html_doc = doc["fields"]["html"]
+        html_doc = xml_fixup(html_doc)
+        soup = BeautifulSoup(html_doc, "html5lib")
+        remove_notext_tags(soup)
+        data = split_text(soup, doc["fields"]["path"])
+        for paragraph_id, header, paragraph in data:
+            paragraph = paragraph.lstrip("\n").lstrip(" ")
+            paragraph = paragraph.rstrip("\n")
+
+            paragraph = multi_newline_pattern.sub("\n\n", paragraph)
+
+            paragraph = fence_open_pattern.sub("\n```", paragraph)
+            paragraph = fence_close_pattern.sub("```\n", paragraph)
+            paragraph = mathjax_pattern.sub("", paragraph)
+            paragraph = copyright_pattern.sub("", paragraph)
+            paragraph = paragraph.replace("\uf0c1", "")
+
+            paragraph = fence_replacement_pattern.sub(
+                lambda m: fence_replacements[m.group(0)], paragraph
+            )
+            # Strip backslashes to avoid double escaping
+            paragraph = paragraph.replace(
+                "\\", ""
+            )  # Necessary backslashes and quotes will be added when json-serialized.
+            paragraph = remove_jekyll(paragraph)
+            paragraph = remove_notebook_cells(paragraph)
+            paragraph = replace_long_integer_sequences(paragraph)
+
+            if paragraph:
+                paragraph_doc = create_text_doc(
+                    doc, paragraph, paragraph_id, header
                 )
-                paragraph = re.sub("\uf0c1", "", paragraph)
-
-                paragraph = paragraph.replace("```\njson", "```json")
-                paragraph = paragraph.replace("```\nxml", "```xml")
-                paragraph = paragraph.replace("```\nbash", "```bash")
-                paragraph = paragraph.replace("```\nsh", "```sh")
-                paragraph = paragraph.replace("```\nraw", "```\n")
-                paragraph = paragraph.replace("```\njava", "```java\n")
-                paragraph = paragraph.replace("\n```\n[ ]:\n```", "\n")
-                paragraph = paragraph.replace("\n```\n[1]:\n```", "\n")
-                # Strip backslashes to avoid double escaping
-                paragraph = paragraph.replace(
-                    "\\", ""
-                )  # Necessary backslashes and quotes will be added when json-serialized.
-                paragraph = remove_jekyll(paragraph)
-                paragraph = remove_notebook_cells(paragraph)
-                paragraph = replace_long_integer_sequences(paragraph)
-
-                if paragraph:
-                    paragraph_doc = create_text_doc(
-                        doc, paragraph, paragraph_id, header
+                n_tokens = paragraph_doc["fields"]["content_tokens"]
+                if n_tokens > 4096:
+                    print(
+                        f"Warning: paragraph with {n_tokens} tokens: {paragraph_doc['fields']['path']}"
                     )
-                    n_tokens = paragraph_doc["fields"]["content_tokens"]
-                    if n_tokens > 4096:
-                        print(
-                            f"Warning: paragraph with {n_tokens} tokens: {paragraph_doc['fields']['path']}"
-                        )
-                    operations.append(paragraph_doc)
+                operations.append(paragraph_doc)
 
     # Merge question expansion
     questions_expansion = dict()
+    json_loads = orjson.loads if orjson is not None else json.loads
     with open(sys.argv[3]) as fp:
         for line in fp:
-            op = json.loads(line)
+            op = json_loads(line)
             id = op["update"]
             fields = op["fields"]
             if "questions" in fields:
@@ -349,8 +385,7 @@ def main():
             op["fields"]["questions"] = questions_expansion[id]
         else:
             op["fields"]["questions"] = [op["fields"]["title"]]
-    with open("paragraph_index.json", "w") as fp:
-        json.dump(operations, fp)
+    dump_json(operations, "paragraph_index.json")
 
 
 if __name__ == "__main__":
@@ -6,6 +6,8 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import yaml
 import requests
 from requests.adapters import HTTPAdapter, Retry
@@ -75,13 +77,22 @@ def vespa_visit(endpoint, namespace, doc_type, continuation=None):
 
 def vespa_remove(endpoint, doc_ids, namespace, doc_type):
     options = []
-    for doc_id in doc_ids:
-        id = get_document_id(doc_id)
-        vespa_delete(
-            endpoint,
-            "document/v1/{0}/{1}/docid/{2}".format(namespace, doc_type, id),
-            options,
-        )
+    # The deletes are independent blocking round-trips; issue them concurrently
+    # over the pooled session instead of one at a time.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = [
+            executor.submit(
+                vespa_delete,
+                endpoint,
+                "document/v1/{0}/{1}/docid/{2}".format(
+                    namespace, doc_type, get_document_id(doc_id)
+                ),
+                options,
+            )
+            for doc_id in doc_ids
+        ]
+        for future in futures:
+            future.result()
 
 
 def vespa_feed(endpoint, feed, namespace, doc_type):
@@ -120,27 +131,26 @@ def get_indexed_docids(endpoint, namespace, doc_type):
     return docids
 
 
+@lru_cache(maxsize=None)
 def get_feed_docids(feed, namespace, doc_type):
+    # Cached: with several feed endpoints the same feed files would otherwise
+    # be read and parsed once per endpoint.
     with open(feed, "r", encoding="utf-8") as f:
         feed_json = json.load(f)
     if doc_type == "doc":
-        return set(
-            [
-                "id:{0}:doc::".format(namespace)
-                + find(doc, "fields.namespace")
-                + find(doc, "fields.path")
-                for doc in feed_json
-            ]
-        )
+        return {
+            "id:{0}:doc::".format(namespace)
+            + find(doc, "fields.namespace")
+            + find(doc, "fields.path")
+            for doc in feed_json
+        }
     elif doc_type == "term":
-        return set(
-            [
-                "id:{0}:term::".format(namespace) + str(find(doc, "fields.hash"))
-                for doc in feed_json
-            ]
-        )
+        return {
+            "id:{0}:term::".format(namespace) + str(find(doc, "fields.hash"))
+            for doc in feed_json
+        }
     elif doc_type == "paragraph":
-        return set([doc["put"] for doc in feed_json])
+        return {doc["put"] for doc in feed_json}
 
 
 def print_header(msg):
@@ -181,9 +191,7 @@ def update_endpoint(endpoint, config):
         print_header("Parsing feed file(s) for document ids")
         for index in endpoint_indexes:
             assert os.path.exists(index)
-            docids_in_feed = docids_in_feed.union(
-                get_feed_docids(index, namespace, doc_type)
-            )
+            docids_in_feed.update(get_feed_docids(index, namespace, doc_type))
         print("{0} documents found.".format(len(docids_in_feed)))
 
         if len(docids_in_feed) == 0:
@@ -216,7 +224,10 @@ def main():
     retries = Retry(
         total=10, connect=10, backoff_factor=0.8, status_forcelist=[500, 503, 504, 429]
     )
-    session.mount("https://", HTTPAdapter(max_retries=retries))
+    session.mount(
+        "https://",
+        HTTPAdapter(max_retries=retries, pool_connections=16, pool_maxsize=16),
+    )
     session.cert = (get_public_cert_path(), get_private_key_path())
     for endpoint in config["search"]["feed_endpoints"]:
         update_endpoint(endpoint, config)
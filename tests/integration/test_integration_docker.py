@@ -615,21 +615,23 @@ class TestApplicationCommon(unittest.TestCase):
             self.assertEqual(response.status_code, 404)
             self.assertTrue("trace" in response.json)
 
-            # Feed some data points
-            feed = []
-            for fields in fields_to_send:
-                feed.append(
-                    asyncio.create_task(
-                        async_app.feed_data_point(
-                            schema=schema_name,
-                            data_id=fields["id"],
-                            fields=fields,
-                            timeout=10,
-                        )
+            # Feed all data points concurrently, bounded by a semaphore so we
+            # do not overwhelm the endpoint when the list grows.
+            semaphore = asyncio.Semaphore(32)
+            feed_results = await asyncio.gather(
+                *[
+                    async_app.feed_data_point(
+                        schema=schema_name,
+                        data_id=fields["id"],
+                        fields=fields,
+                        semaphore=semaphore,
+                        timeout=10,
                     )
-                )
-            await asyncio.wait(feed, return_when=asyncio.ALL_COMPLETED)
-            result = feed[0].result().json
+                    for fields in fields_to_send
+                ]
+            )
+            fields = fields_to_send[-1]
+            result = feed_results[0].json
             self.assertEqual(
                 result["id"],
                 "id:{}:{}::{}".format(
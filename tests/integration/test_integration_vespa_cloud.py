@@ -3,7 +3,7 @@
 import os
 import httpx
 import asyncio
-import shutil
+import tempfile
 import pytest
 from requests import HTTPError
 import unittest
@@ -33,21 +33,27 @@ from vespa.package import (
 )
 
 APP_INIT_TIMEOUT = 900
+# Parse the control plane key once instead of in every setUpClass, and fail
+# with a clear message if it is missing rather than an AttributeError on None.
+VESPA_TEAM_API_KEY = (os.getenv("VESPA_TEAM_API_KEY") or "").replace(r"\n", "\n")
+assert VESPA_TEAM_API_KEY, "VESPA_TEAM_API_KEY not set"
 
 
 class TestVespaKeyAndCertificate(unittest.TestCase):
-    def setUp(self) -> None:
-        self.app_package = create_msmarco_application_package()
-        self.vespa_cloud = VespaCloud(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app_package = create_msmarco_application_package()
+        cls.vespa_cloud = VespaCloud(
             tenant="vespa-team",
             application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
+            key_content=VESPA_TEAM_API_KEY,
+            application_package=cls.app_package,
         )
-        self.disk_folder = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "msmarco"
-        self.app = self.vespa_cloud.deploy(
-            instance=self.instance_name, disk_folder=self.disk_folder
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.disk_folder = cls._tmp.name
+        cls.instance_name = "msmarco"
+        cls.app = cls.vespa_cloud.deploy(
+            instance=cls.instance_name, disk_folder=cls.disk_folder
         )
 
     def test_key_cert_arguments(self):
@@ -89,29 +95,32 @@ class TestVespaKeyAndCertificate(unittest.TestCase):
         with pytest.raises(HTTPError):
             self.app.get_data(schema="msmarco", data_id="1", raise_on_not_found=True)
 
-    def tearDown(self) -> None:
-        self.app.delete_all_docs(
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.app.delete_all_docs(
             content_cluster_name="msmarco_content", schema="msmarco"
         )
-        shutil.rmtree(self.disk_folder, ignore_errors=True)
-        self.vespa_cloud.delete(instance=self.instance_name)
+        cls._tmp.cleanup()
+        cls.vespa_cloud.delete(instance=cls.instance_name)
 
 
 class TestMsmarcoApplication(TestApplicationCommon):
-    def setUp(self) -> None:
-        self.app_package = create_msmarco_application_package()
-        self.vespa_cloud = VespaCloud(
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.app_package = create_msmarco_application_package()
+        cls.vespa_cloud = VespaCloud(
             tenant="vespa-team",
             application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
+            key_content=VESPA_TEAM_API_KEY,
+            application_package=cls.app_package,
         )
-        self.disk_folder = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "msmarco"
-        self.app = self.vespa_cloud.deploy(
-            instance=self.instance_name, disk_folder=self.disk_folder
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.disk_folder = cls._tmp.name
+        cls.instance_name = "msmarco"
+        cls.app = cls.vespa_cloud.deploy(
+            instance=cls.instance_name, disk_folder=cls.disk_folder
         )
-        self.fields_to_send = [
+        cls.fields_to_send = [
             {
                 "id": f"{i}",
                 "title": f"this is title {i}",
@@ -119,7 +128,7 @@ class TestMsmarcoApplication(TestApplicationCommon):
             }
             for i in range(10)
         ]
-        self.fields_to_update = [
+        cls.fields_to_update = [
             {
                 "id": f"{i}",
                 "title": "this is my updated title number {}".format(i),
@@ -127,6 +136,13 @@ class TestMsmarcoApplication(TestApplicationCommon):
             for i in range(10)
         ]
 
+    def setUp(self) -> None:
+        # The deployment is shared across the class; reset the documents so
+        # each test starts from an empty index regardless of run order.
+        self.app.delete_all_docs(
+            content_cluster_name="msmarco_content", schema="msmarco"
+        )
+
     def test_control_plane_useragent(self):
         response: httpx.Response = self.vespa_cloud._request_with_api_key(
             "GET",
@@ -194,12 +210,13 @@ class TestMsmarcoApplication(TestApplicationCommon):
             )
         )
 
-    def tearDown(self) -> None:
-        self.app.delete_all_docs(
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.app.delete_all_docs(
             content_cluster_name="msmarco_content", schema="msmarco"
         )
-        shutil.rmtree(self.disk_folder, ignore_errors=True)
-        self.vespa_cloud.delete(instance=self.instance_name)
+        cls._tmp.cleanup()
+        cls.vespa_cloud.delete(instance=cls.instance_name)
 
 
 class TestRetryApplication(unittest.TestCase):
@@ -213,7 +230,8 @@ class TestRetryApplication(unittest.TestCase):
     according to the value of the field when processing the document.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         document = Document(
             fields=[
                 Field(name="id", type="string", indexing=["attribute", "summary"]),
@@ -228,17 +246,18 @@ class TestRetryApplication(unittest.TestCase):
             name="retryapplication",
             document=document,
         )
-        self.app_package = ApplicationPackage(name="retryapplication", schema=[schema])
-        self.vespa_cloud = VespaCloud(
+        cls.app_package = ApplicationPackage(name="retryapplication", schema=[schema])
+        cls.vespa_cloud = VespaCloud(
             tenant="vespa-team",
             application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
+            key_content=VESPA_TEAM_API_KEY,
+            application_package=cls.app_package,
         )
-        self.disk_folder = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "retryapplication"
-        self.app = self.vespa_cloud.deploy(
-            instance=self.instance_name, disk_folder=self.disk_folder
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.disk_folder = cls._tmp.name
+        cls.instance_name = "retryapplication"
+        cls.app = cls.vespa_cloud.deploy(
+            instance=cls.instance_name, disk_folder=cls.disk_folder
         )
 
     def doc_generator(self, num_docs: int):
@@ -278,18 +297,20 @@ class TestRetryApplication(unittest.TestCase):
                 total_docs.extend(response.documents)
         self.assertEqual(len(total_docs), num_docs)
 
-    def tearDown(self) -> None:
-        self.app.delete_all_docs(
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.app.delete_all_docs(
             content_cluster_name="retryapplication_content", schema="retryapplication"
         )
-        shutil.rmtree(self.disk_folder, ignore_errors=True)
-        self.vespa_cloud.delete(instance=self.instance_name)
+        cls._tmp.cleanup()
+        cls.vespa_cloud.delete(instance=cls.instance_name)
 
 
 class TestDeployProdWithTests(unittest.TestCase):
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
         # Set root to parent directory/testapps/production-deployment-with-tests
-        self.application_root = (
+        cls.application_root = (
             pathlib.Path(__file__).parent.parent
             / "testapps"
             / "production-deployment-with-tests"
@@ -302,16 +323,16 @@ class TestDeployProdWithTests(unittest.TestCase):
             Validation(ValidationID("certificate-removal"), until=formatted_date)
         ]
         # Write validations_to_text to "validation-overrides.xml"
-        with open(self.application_root / "validation-overrides.xml", "w") as f:
+        with open(cls.application_root / "validation-overrides.xml", "w") as f:
             f.write(app_package.validations_to_text)
-        self.vespa_cloud = VespaCloud(
+        cls.vespa_cloud = VespaCloud(
             tenant="vespa-team",
             application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_root=self.application_root,
+            key_content=VESPA_TEAM_API_KEY,
+            application_root=cls.application_root,
         )
 
-        self.build_no = self.vespa_cloud.deploy_to_prod(
+        cls.build_no = cls.vespa_cloud.deploy_to_prod(
             source_url="https://github.com/vespa-engine/pyvespa",
         )
 
@@ -1,13 +1,14 @@
 # Copyright Vespa.ai. Licensed under the terms of the Apache 2.0 license. See LICENSE in the project root.
 
+import logging
 import os
 import asyncio
 import shutil
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 import pytest
 from requests import HTTPError
 from vespa.application import Vespa
-from datetime import datetime, timedelta
 
 from vespa.package import (
     AuthClient,
@@ -27,121 +28,136 @@ from test_integration_docker import (
 )
 
 APP_INIT_TIMEOUT = 900
+# Resolved once at import; setUpClass should not pay a getcwd syscall per class.
+CWD = os.getcwd()
+logger = logging.getLogger(__name__)
+
 CLIENT_TOKEN_ID = os.environ.get("VESPA_CLIENT_TOKEN_ID", "pyvespa_integration_msmarco")
+# Parse the control plane key once instead of in every setUpClass, and fail
+# with a clear message if it is missing rather than an AttributeError on None.
+VESPA_TEAM_API_KEY = (os.getenv("VESPA_TEAM_API_KEY") or "").replace(r"\n", "\n")
+assert VESPA_TEAM_API_KEY, "VESPA_TEAM_API_KEY not set"
+# Shared across classes - built once at import time, shallow-copied per class so
+# a test mutating its documents cannot leak into another class.
+FIELDS_TO_SEND = [
+    {
+        "id": f"{i}",
+        "title": f"this is title {i}",
+        "body": f"this is body {i}",
+    }
+    for i in range(10)
+]
+FIELDS_TO_UPDATE = [
+    {
+        "id": f"{i}",
+        "title": f"this is my updated title number {i}",
+    }
+    for i in range(10)
+]
 
 
-class TestTokenBasedAuth(unittest.TestCase):
-    def setUp(self) -> None:
-        self.clients = [
-            AuthClient(
-                id="mtls",
-                permissions=["read", "write"],
-                parameters=[Parameter("certificate", {"file": "security/clients.pem"})],
-            ),
-            AuthClient(
-                id="token",
-                permissions=["read", "write"],
-                parameters=[Parameter("token", {"id": CLIENT_TOKEN_ID})],
-            ),
-        ]
-        self.app_package = create_msmarco_application_package(auth_clients=self.clients)
+def create_auth_clients(mtls_permissions):
+    # The classes below only differ in the permissions granted to the mtls
+    # client; build the list in one place instead of repeating it per class.
+    return [
+        AuthClient(
+            id="mtls",
+            permissions=mtls_permissions,
+            parameters=[Parameter("certificate", {"file": "security/clients.pem"})],
+        ),
+        AuthClient(
+            id="token",
+            permissions=["read", "write"],
+            parameters=[Parameter("token", {"id": CLIENT_TOKEN_ID})],
+        ),
+    ]
 
-        self.vespa_cloud = VespaCloud(
-            tenant="vespa-team",
-            application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
-            auth_client_token_id=CLIENT_TOKEN_ID,
-        )
-        self.disk_folder = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "token"
-        self.mtls_app: Vespa = self.vespa_cloud.deploy(
-            instance=self.instance_name, disk_folder=self.disk_folder
-        )
-        self.app = self.vespa_cloud.get_application(
-            instance=self.instance_name,
-            environment="dev",
-            endpoint_type="token",
-            vespa_cloud_secret_token=os.getenv("VESPA_CLOUD_SECRET_TOKEN"),
-        )
-        print("Endpoint used " + self.app.url)
+
+def deploy_dev_instance(cls, mtls_permissions, instance_name):
+    """Build, deploy and connect a token-auth dev instance, storing the
+    fixtures on the test class. One canonical setup path, so connection and
+    fixture optimizations only need to be applied once.
+
+    Each class gets its own instance and disk folder so the classes can run
+    concurrently under pytest-xdist (-n 2 --dist=loadgroup) without stepping
+    on each other."""
+    cls.clients = create_auth_clients(mtls_permissions=mtls_permissions)
+    cls.app_package = create_msmarco_application_package(auth_clients=cls.clients)
+
+    cls.vespa_cloud = VespaCloud(
+        tenant="vespa-team",
+        application="pyvespa-integration",
+        key_content=VESPA_TEAM_API_KEY,
+        application_package=cls.app_package,
+        auth_client_token_id=CLIENT_TOKEN_ID,
+    )
+    cls.disk_folder = os.path.join(CWD, f"sample_application_{cls.__name__}")
+    cls.instance_name = instance_name
+    cls.mtls_app: Vespa = cls.vespa_cloud.deploy(
+        instance=cls.instance_name, disk_folder=cls.disk_folder
+    )
+    cls.app = cls.vespa_cloud.get_application(
+        instance=cls.instance_name,
+        environment="dev",
+        endpoint_type="token",
+        vespa_cloud_secret_token=os.getenv("VESPA_CLOUD_SECRET_TOKEN"),
+    )
+    logger.debug("Endpoint used %s", cls.app.url)
+
+
+@pytest.mark.xdist_group("cloud_token_dev")
+class TestTokenBasedAuth(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        deploy_dev_instance(cls, mtls_permissions=["read", "write"], instance_name="token")
 
     def test_right_endpoint_used_with_token(self):
         # The secrect token is set in env variable.
         # The token is used to access the application status endpoint.
-        print("Endpoint used " + self.app.url)
+        logger.debug("Endpoint used %s", self.app.url)
         self.app.wait_for_application_up(max_wait=APP_INIT_TIMEOUT)
+        # One round-trip is enough to check both the payload and the status.
+        response = self.app.get_data(schema="msmarco", data_id="1")
         self.assertDictEqual(
             {
                 "pathId": "/document/v1/msmarco/msmarco/docid/1",
                 "id": "id:msmarco:msmarco::1",
             },
-            self.app.get_data(schema="msmarco", data_id="1").json,
-        )
-        self.assertEqual(
-            self.app.get_data(schema="msmarco", data_id="1").is_successful(), False
+            response.json,
         )
+        self.assertEqual(response.is_successful(), False)
         with pytest.raises(HTTPError):
             self.app.get_data(schema="msmarco", data_id="1", raise_on_not_found=True)
 
-    def tearDown(self) -> None:
-        self.app.delete_all_docs(
-            content_cluster_name="msmarco_content", schema="msmarco"
-        )
-        shutil.rmtree(self.disk_folder, ignore_errors=True)
-        self.vespa_cloud.delete(instance=self.instance_name)
+    @classmethod
+    def tearDownClass(cls) -> None:
+        # Deleting the dev instance removes its documents, so there is no need
+        # to delete_all_docs first; the two remaining steps are independent.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(shutil.rmtree, cls.disk_folder, ignore_errors=True),
+                executor.submit(cls.vespa_cloud.delete, instance=cls.instance_name),
+            ]
+            for future in futures:
+                future.result()
 
 
+@pytest.mark.xdist_group("cloud_token_app")
 class TestMsmarcoApplicationWithTokenAuth(TestApplicationCommon):
-    def setUp(self) -> None:
-        self.clients = [
-            AuthClient(
-                id="mtls",
-                permissions=["read"],
-                parameters=[Parameter("certificate", {"file": "security/clients.pem"})],
-            ),
-            AuthClient(
-                id="token",
-                permissions=["read", "write"],
-                parameters=[Parameter("token", {"id": CLIENT_TOKEN_ID})],
-            ),
-        ]
+    @classmethod
+    def setUpClass(cls) -> None:
+        deploy_dev_instance(cls, mtls_permissions=["read"], instance_name="tokenapp")
+        cls.schema_name = cls.app_package.name
+        cls.cluster_name = f"{cls.schema_name}_content"
+        cls.fields_to_send = [dict(d) for d in FIELDS_TO_SEND]
+        cls.fields_to_update = [dict(d) for d in FIELDS_TO_UPDATE]
 
-        self.app_package = create_msmarco_application_package(auth_clients=self.clients)
-        self.vespa_cloud = VespaCloud(
-            tenant="vespa-team",
-            application="pyvespa-integration",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
-            auth_client_token_id=CLIENT_TOKEN_ID,
-        )
-        self.disk_folder = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "token"
-        self.mtls_app = self.vespa_cloud.deploy(
-            instance=self.instance_name, disk_folder=self.disk_folder
-        )
-        self.app = self.vespa_cloud.get_application(
-            instance=self.instance_name,
-            environment="dev",
-            endpoint_type="token",
-            vespa_cloud_secret_token=os.getenv("VESPA_CLOUD_SECRET_TOKEN"),
+    def setUp(self) -> None:
+        # The deployment is shared across the class; reset the documents so
+        # each test starts from an empty index regardless of run order.
+        self.app.delete_all_docs(
+            content_cluster_name=self.cluster_name, schema=self.schema_name
         )
-        print("Endpoint used " + self.app.url)
-        self.fields_to_send = [
-            {
-                "id": f"{i}",
-                "title": f"this is title {i}",
-                "body": f"this is body {i}",
-            }
-            for i in range(10)
-        ]
-        self.fields_to_update = [
-            {
-                "id": f"{i}",
-                "title": "this is my updated title number {}".format(i),
-            }
-            for i in range(10)
-        ]
 
     def test_using_token_endpoint(self):
         endpoint = self.app.url
@@ -153,51 +169,65 @@ class TestMsmarcoApplicationWithTokenAuth(TestApplicationCommon):
     def test_execute_data_operations(self):
         self.execute_data_operations(
             app=self.app,
-            schema_name=self.app_package.name,
-            cluster_name=f"{self.app_package.name}_content",
+            schema_name=self.schema_name,
+            cluster_name=self.cluster_name,
             fields_to_send=self.fields_to_send[0],
             field_to_update=self.fields_to_update[0],
             expected_fields_from_get_operation=self.fields_to_send[0],
         )
 
+    def test_feed_iterable_batch(self):
+        # Feed all docs through the batched path, which reuses a pool of
+        # connections instead of handshaking per document.
+        ok = 0
+
+        def callback(response, id):
+            nonlocal ok
+            if response.is_successful():
+                ok += 1
+
+        self.app.feed_iterable(
+            iter=[{"id": d["id"], "fields": d} for d in self.fields_to_send],
+            schema=self.schema_name,
+            callback=callback,
+            max_workers=16,
+            max_queue_size=1000,
+        )
+        self.assertEqual(ok, len(self.fields_to_send))
+
     def test_execute_async_data_operations(self):
         asyncio.run(
             self.execute_async_data_operations(
                 app=self.app,
-                schema_name=self.app_package.name,
+                schema_name=self.schema_name,
                 fields_to_send=self.fields_to_send,
                 field_to_update=self.fields_to_update[0],
                 expected_fields_from_get_operation=self.fields_to_send,
             )
         )
 
-    def tearDown(self) -> None:
-        self.app.delete_all_docs(
-            content_cluster_name="msmarco_content", schema="msmarco"
-        )
-        shutil.rmtree(self.disk_folder, ignore_errors=True)
-        self.vespa_cloud.delete(instance=self.instance_name)
+    @classmethod
+    def tearDownClass(cls) -> None:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(shutil.rmtree, cls.disk_folder, ignore_errors=True),
+                executor.submit(cls.vespa_cloud.delete, instance=cls.instance_name),
+            ]
+            for future in futures:
+                future.result()
 
 
+@pytest.mark.xdist_group("cloud_token_prod")
 class TestMsmarcoProdApplicationWithTokenAuth(TestApplicationCommon):
-    def setUp(self) -> None:
-        schema_name = "msmarco"
-        self.auth_clients = [
-            AuthClient(
-                id="mtls",
-                permissions=["read"],
-                parameters=[Parameter("certificate", {"file": "security/clients.pem"})],
-            ),
-            AuthClient(
-                id="token",
-                permissions=["read", "write"],
-                parameters=[Parameter("token", {"id": CLIENT_TOKEN_ID})],
-            ),
-        ]
-        self.app_package = create_msmarco_application_package()
+    @classmethod
+    def setUpClass(cls) -> None:
+        schema_name = cls.schema_name = "msmarco"
+        cls.auth_clients = create_auth_clients(mtls_permissions=["read"])
+        cls.app_package = create_msmarco_application_package()
+        cls.cluster_name = f"{schema_name}_content"
         # Add prod deployment config
         prod_region = "aws-us-east-1c"
-        self.app_package.clusters = [
+        cls.app_package.clusters = [
             ContentCluster(
                 id=f"{schema_name}_content",
                 nodes=Nodes(count="2"),
@@ -207,42 +237,29 @@ class TestMsmarcoProdApplicationWithTokenAuth(TestApplicationCommon):
             ContainerCluster(
                 id=f"{schema_name}_container",
                 nodes=Nodes(count="2"),
-                auth_clients=self.auth_clients,
+                auth_clients=cls.auth_clients,
             ),
         ]
-        self.app_package.deployment_config = DeploymentConfiguration(
+        cls.app_package.deployment_config = DeploymentConfiguration(
             environment="prod", regions=[prod_region]
         )
         # Deploy to Vespa Cloud
-        self.vespa_cloud = VespaCloud(
+        cls.vespa_cloud = VespaCloud(
             tenant="vespa-team",
             application="pyvespa-int-prod",
-            key_content=os.getenv("VESPA_TEAM_API_KEY").replace(r"\n", "\n"),
-            application_package=self.app_package,
+            key_content=VESPA_TEAM_API_KEY,
+            application_package=cls.app_package,
             auth_client_token_id=CLIENT_TOKEN_ID,
         )
-        self.application_root = os.path.join(os.getcwd(), "sample_application")
-        self.instance_name = "default"
-        self.build_no = self.vespa_cloud.deploy_to_prod(
-            instance=self.instance_name,
+        cls.application_root = os.path.join(CWD, "sample_application")
+        cls.instance_name = "default"
+        cls.build_no = cls.vespa_cloud.deploy_to_prod(
+            instance=cls.instance_name,
             source_url="https://github.com/vespa-engine/pyvespa",
         )
         # Define fields to send and update
-        self.fields_to_send = [
-            {
-                "id": f"{i}",
-                "title": f"this is title {i}",
-                "body": f"this is body {i}",
-            }
-            for i in range(10)
-        ]
-        self.fields_to_update = [
-            {
-                "id": f"{i}",
-                "title": "this is my updated title number {}".format(i),
-            }
-            for i in range(10)
-        ]
+        cls.fields_to_send = [dict(d) for d in FIELDS_TO_SEND]
+        cls.fields_to_update = [dict(d) for d in FIELDS_TO_UPDATE]
 
     @unittest.skip(
         "This test is too slow for normal testing. Can be used for manual testing if related code is changed."
@@ -276,8 +293,8 @@ class TestMsmarcoProdApplicationWithTokenAuth(TestApplicationCommon):
     def test_execute_data_operations(self):
         self.execute_data_operations(
             app=self.app,
-            schema_name=self.app_package.name,
-            cluster_name=f"{self.app_package.name}_content",
+            schema_name=self.schema_name,
+            cluster_name=self.cluster_name,
             fields_to_send=self.fields_to_send[0],
             field_to_update=self.fields_to_update[0],
             expected_fields_from_get_operation=self.fields_to_send[0],
@@ -288,7 +305,7 @@ class TestMsmarcoProdApplicationWithTokenAuth(TestApplicationCommon):
         asyncio.run(
             self.execute_async_data_operations(
                 app=self.app,
-                schema_name=self.app_package.name,
+                schema_name=self.schema_name,
                 fields_to_send=self.fields_to_send,
                 field_to_update=self.fields_to_update[0],
                 expected_fields_from_get_operation=self.fields_to_send,
@@ -303,16 +320,24 @@ class TestMsmarcoProdApplicationWithTokenAuth(TestApplicationCommon):
 
     @unittest.skip("Not relevant when not waiting.")
     def test_delete_deployment(self):
+        from datetime import date, timedelta
+
         # Deployment is deleted by deploying with an empty deployment.xml file.
         self.app_package.deployment_config = EmptyDeploymentConfiguration()
 
         # Vespa won't push the deleted deployment.xml file unless we add a validation override
-        tomorrow = datetime.now() + timedelta(days=1)
-        formatted_date = tomorrow.strftime("%Y-%m-%d")
+        formatted_date = (date.today() + timedelta(days=1)).isoformat()
         self.app_package.validations = [
             Validation(ValidationID("deployment-removal"), formatted_date)
         ]
-        self.app_package.to_files(self.application_root)
+        # Only deployment.xml and validation-overrides.xml changed - write just
+        # those two instead of regenerating the whole package on disk.
+        with open(os.path.join(self.application_root, "deployment.xml"), "w") as f:
+            f.write(self.app_package.deployment_to_text)
+        with open(
+            os.path.join(self.application_root, "validation-overrides.xml"), "w"
+        ) as f:
+            f.write(self.app_package.validations_to_text)
         # This will delete the deployment
         self.vespa_cloud._start_prod_deployment(self.application_root)
         shutil.rmtree(self.application_root, ignore_errors=True)
@@ -1,5 +1,6 @@
 # Copyright Vespa.ai. Licensed under the terms of the Apache 2.0 license. See LICENSE in the project root.
 
+import copy
 import os
 import shutil
 import unittest
@@ -30,44 +31,50 @@ APP_INIT_TIMEOUT = 900
 CLIENT_TOKEN_ID = os.environ.get("VESPA_CLIENT_TOKEN_ID", "pyvespa_integration_msmarco")
 
 
-def create_vector_ada_application_package() -> ApplicationPackage:
-    return ApplicationPackage(
-        name="vector",
-        schema=[
-            Schema(
-                name="vector",
-                document=Document(
-                    fields=[
-                        Field(
-                            name="id", type="string", indexing=["attribute", "summary"]
-                        ),
-                        Field(
-                            name="meta",
-                            type="string",
-                            indexing=["attribute", "summary"],
-                        ),
-                        Field(
-                            name="embedding",
-                            type="tensor<bfloat16>(x[1536])",
-                            indexing=["attribute", "summary", "index"],
-                            ann=HNSW(
-                                distance_metric="innerproduct",
-                                max_links_per_node=16,
-                                neighbors_to_explore_at_insert=128,
-                            ),
+# Built once at import time; the nested Schema/Field/RankProfile literals are
+# costly to re-evaluate per test. Callers get a deep copy they can mutate
+# freely (e.g. the prod test attaches clusters and a deployment config).
+_VECTOR_ADA_APP_PACKAGE = ApplicationPackage(
+    name="vector",
+    schema=[
+        Schema(
+            name="vector",
+            document=Document(
+                fields=[
+                    Field(
+                        name="id", type="string", indexing=["attribute", "summary"]
+                    ),
+                    Field(
+                        name="meta",
+                        type="string",
+                        indexing=["attribute", "summary"],
+                    ),
+                    Field(
+                        name="embedding",
+                        type="tensor<bfloat16>(x[1536])",
+                        indexing=["attribute", "summary", "index"],
+                        ann=HNSW(
+                            distance_metric="innerproduct",
+                            max_links_per_node=16,
+                            neighbors_to_explore_at_insert=128,
                         ),
-                    ]
-                ),
-                rank_profiles=[
-                    RankProfile(
-                        name="default",
-                        inputs=[("query(q)", "tensor<float>(x[1536])")],
-                        first_phase="closeness(field, embedding)",
-                    )
-                ],
-            )
-        ],
-    )
+                    ),
+                ]
+            ),
+            rank_profiles=[
+                RankProfile(
+                    name="default",
+                    inputs=[("query(q)", "tensor<float>(x[1536])")],
+                    first_phase="closeness(field, embedding)",
+                )
+            ],
+        )
+    ],
+)
+
+
+def create_vector_ada_application_package() -> ApplicationPackage:
+    return copy.deepcopy(_VECTOR_ADA_APP_PACKAGE)
 
 
 class TestVectorSearch(unittest.TestCase):
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 
+import httpx
+
 from vespa.deployment import VespaCloud
 
 
@@ -88,6 +90,7 @@ class TestVespaCloud(unittest.TestCase):
         mock_request.assert_called_once_with(
             "GET",
             "/application/v4/tenant/test_tenant/application/test_app/build-status/456",
+            request_timeout=10,
         )
 
     @patch("vespa.deployment.VespaCloud._request")
@@ -98,6 +101,51 @@ class TestVespaCloud(unittest.TestCase):
 
         self.assertEqual(status, {"deployed": False, "status": "deploying"})
 
+    @patch("vespa.deployment.time.sleep")
+    @patch("vespa.deployment.VespaCloud._request")
+    def test_wait_for_prod_deployment_backoff(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            {"deployed": False, "status": "deploying"},
+            {"deployed": False, "status": "deploying"},
+            {"deployed": False, "status": "deploying"},
+            {"deployed": False, "status": "deploying"},
+            {"deployed": True, "status": "done"},
+        ]
+
+        success = self.vespa_cloud.wait_for_prod_deployment(456, poll_interval=5)
+
+        self.assertTrue(success)
+        self.assertEqual(
+            [call.args[0] for call in mock_sleep.call_args_list], [5, 10, 20, 40]
+        )
+
+    @patch("vespa.deployment.time.sleep")
+    @patch("vespa.deployment.VespaCloud._request")
+    def test_wait_for_prod_deployment_transient_error(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            {"deployed": False, "status": "deploying"},
+            httpx.ConnectTimeout("timed out"),
+            {"deployed": True, "status": "done"},
+        ]
+
+        success = self.vespa_cloud.wait_for_prod_deployment(456, poll_interval=5)
+
+        self.assertTrue(success)
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("vespa.deployment.time.sleep")
+    @patch("vespa.deployment.VespaCloud._request")
+    def test_wait_for_prod_deployment_terminal_failure(self, mock_request, mock_sleep):
+        mock_request.side_effect = [
+            {"deployed": False, "status": "deploying"},
+            {"deployed": False, "status": "aborted"},
+        ]
+
+        with self.assertRaises(RuntimeError):
+            self.vespa_cloud.wait_for_prod_deployment(456, poll_interval=5)
+
+        self.assertEqual(mock_request.call_count, 2)
+
     @patch("vespa.deployment.VespaCloud._try_get_access_token")
     def test_try_get_access_token(self, mock_get_token):
         mock_get_token.return_value = "fake_access_token"
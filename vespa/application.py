@@ -41,6 +41,7 @@ from io import BytesIO
 import logging
 
 logging.getLogger("urllib3").setLevel(logging.ERROR)
+logger = logging.getLogger(__name__)
 
 VESPA_CLOUD_SECRET_TOKEN: str = "VESPA_CLOUD_SECRET_TOKEN"
 
@@ -956,7 +957,8 @@ class Vespa(object):
         # Make sure `id` is properly quoted, e.g. myid#123 -> myid%23123
         id = quote(str(id))
         if not schema:
-            print("schema is not provided. Attempting to infer schema name.")
+            # This runs once per document operation - log instead of printing.
+            logger.debug("schema is not provided. Attempting to infer schema name.")
             schema = self._infer_schema_name()
         if not namespace:
             namespace = schema
@@ -1020,8 +1022,8 @@ class CustomHTTPAdapter(HTTPAdapter):
     def _maybe_compress_request(self, request: PreparedRequest):
         # Compress if the method is POST or PUT, body exists, and compression conditions are met
         if (
-            self.compress in [True, "auto"]
-            and request.method in ["POST", "PUT"]
+            self.compress in (True, "auto")
+            and request.method in ("POST", "PUT")
             and request.body
         ):
             body_size = (
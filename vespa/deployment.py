@@ -562,6 +562,7 @@ class VespaCloud(VespaDeployment):
             max_keepalive_connections=20,
             keepalive_expiry=10,
         )
+        self._httpx_client: Optional[httpx.Client] = None
         self.base_url = "https://api-ctl.vespa-cloud.com:4443"
         self.pyvespa_version = vespa.__version__
         self.base_headers = {"User-Agent": f"pyvespa/{self.pyvespa_version}"}
@@ -587,6 +588,26 @@ class VespaCloud(VespaDeployment):
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
+    def close(self) -> None:
+        """Close the underlying connection to the Vespa Cloud control plane."""
+        if self._httpx_client is not None and not self._httpx_client.is_closed:
+            self._httpx_client.close()
+
+    def _get_httpx_client(self) -> httpx.Client:
+        # Reuse one client (and thus its TLS connections) across control plane
+        # requests instead of handshaking per call.
+        if self._httpx_client is None or self._httpx_client.is_closed:
+            self._httpx_client = httpx.Client(
+                base_url=self.base_url,
+                headers=self.base_headers,
+                # Timeout defaults to None to avoid httpx timeout on e.g. deployment
+                # requests. Short requests pass an explicit per-request timeout.
+                timeout=None,
+                http1=True,
+                limits=self.httpx_limits,
+            )
+        return self._httpx_client
+
     # Add property with getter and setter for self.build_no
     @property
     def build_no(self) -> Optional[int]:
@@ -785,11 +806,17 @@ class VespaCloud(VespaDeployment):
         app.wait_for_application_up(max_wait=max_wait)
         return app
 
-    def check_production_build_status(self, build_no: Optional[int]) -> dict:
+    def check_production_build_status(
+        self, build_no: Optional[int], request_timeout: Optional[float] = 10
+    ) -> dict:
         """
         Check the status of a production build.
         Useful for example in CI/CD pipelines to check when a build has converged.
 
+        Note that the build-status endpoint returns immediately - it does not support
+        server-side waiting for a state transition. To wait for a deployment to finish,
+        use :func:`wait_for_prod_deployment`, which polls this endpoint with backoff.
+
         Example usage::
 
             vespa_cloud = VespaCloud(...)
@@ -814,6 +841,8 @@ class VespaCloud(VespaDeployment):
             # }
 
         :param build_no: The build number to check.
+        :param request_timeout: Client-side timeout in seconds for the status request,
+            so a hung socket cannot stall a polling loop. Pass None to disable.
         :return: dict with the aggregated status of all deployment jobs for the given build number.
         """
         if build_no is None:
@@ -825,6 +854,7 @@ class VespaCloud(VespaDeployment):
         status = self._request(
             "GET",
             f"/application/v4/tenant/{self.tenant}/application/{self.application}/build-status/{build_no}",
+            request_timeout=request_timeout,
         )
         return status
 
@@ -833,11 +863,17 @@ class VespaCloud(VespaDeployment):
         build_no: Optional[int] = None,
         max_wait: int = 3600,
         poll_interval: int = 5,
+        max_poll_interval: int = 60,
     ) -> bool:
         """
         Wait for a production deployment to finish.
         Useful for example in CI/CD pipelines to wait for a deployment to finish.
 
+        The polling interval starts at `poll_interval` and doubles after each check,
+        capped at `max_poll_interval`, to avoid hammering the Vespa Cloud API during
+        long deployments. Each status request has a client-side timeout, and transient
+        network errors are retried on the next poll instead of aborting the wait.
+
         Example usage::
 
             vespa_cloud = VespaCloud(...)
@@ -848,17 +884,32 @@ class VespaCloud(VespaDeployment):
 
         :param build_no: The build number to check.
         :param max_wait: Maximum time to wait for the deployment in seconds. Default is 3600 (1 hour).
-        :param poll_interval: Polling interval in seconds. Default is 5 seconds.
+        :param poll_interval: Initial polling interval in seconds. Default is 5 seconds.
+        :param max_poll_interval: Upper bound for the polling interval in seconds. Default is 60 seconds.
 
         :return: True if the deployment is done and converged. False if the deployment has failed.
+        :raises RuntimeError: If the deployment reached a terminal failure state.
         :raises TimeoutError: If the deployment did not finish within max_wait seconds.
         """
+        terminal_fail_statuses = ("error", "aborted", "failed", "invalid")
+        delay = poll_interval
         start_time = time.time()
         while time.time() - start_time < max_wait:
-            status = self.check_production_build_status(build_no)
-            if status["status"] == "done":
-                return status["deployed"]
-            time.sleep(poll_interval)
+            try:
+                status = self.check_production_build_status(build_no)
+            except (httpx.TimeoutException, httpx.TransportError) as e:
+                # Transient network error - treat as "not done yet" and keep polling.
+                print(f"Status check failed, retrying: {e}", file=self.output)
+            else:
+                if status["status"] == "done":
+                    return status["deployed"]
+                elif status["status"] in terminal_fail_statuses:
+                    # No point in polling further - the build will never converge.
+                    raise RuntimeError(
+                        f"Deployment of build {build_no} failed with status '{status['status']}': {status}"
+                    )
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
         raise TimeoutError(f"Deployment did not finish within {max_wait} seconds. ")
 
     def deploy_from_disk(
@@ -1154,6 +1205,7 @@ class VespaCloud(VespaDeployment):
         path,
         body: Optional[Union[BytesIO, Dict]] = None,
         headers: Dict = {},
+        request_timeout: Optional[float] = None,
     ) -> httpx.Response:
         if isinstance(body, dict):
             data = body
@@ -1164,20 +1216,21 @@ class VespaCloud(VespaDeployment):
         else:
             data = None
             content = None
-        with httpx.Client(
-            base_url=self.base_url,
-            headers=self.base_headers,
-            timeout=None,  # Need to set timeout to None to avoid httpx timeout on e.g. deployment requests
-            http1=True,
-            limits=self.httpx_limits,
-        ) as client:
-            response = client.request(
-                method, path, data=data, content=content, headers=headers
+        client = self._get_httpx_client()
+        response = client.request(
+            method,
+            path,
+            data=data,
+            content=content,
+            headers=headers,
+            timeout=request_timeout
+            if request_timeout is not None
+            else httpx.USE_CLIENT_DEFAULT,
+        )
+        if response.status_code != 200:
+            raise HTTPError(
+                f"HTTP {response.status_code} reason: {response.reason_phrase} error_text: {response.text} for {path}"
             )
-            if response.status_code != 200:
-                raise HTTPError(
-                    f"HTTP {response.status_code} reason: {response.reason_phrase} error_text: {response.text} for {path}"
-                )
         return response
 
     def _try_get_access_token(self) -> str:
@@ -1262,6 +1315,7 @@ class VespaCloud(VespaDeployment):
         body: Union[BytesIO, MultipartEncoder] = BytesIO(),
         headers: dict = {},
         return_raw_response: bool = False,
+        request_timeout: Optional[float] = None,
     ) -> Union[dict, httpx.Response]:
         """Make authenticated request with access token"""
         if hasattr(body, "seek"):
@@ -1269,7 +1323,7 @@ class VespaCloud(VespaDeployment):
 
         auth_headers = self._get_auth_headers(headers)
         response = self.get_connection_response_with_retry(
-            method, path, body, auth_headers
+            method, path, body, auth_headers, request_timeout=request_timeout
         )
 
         return self._handle_response(response, return_raw_response, path)
@@ -1280,11 +1334,16 @@ class VespaCloud(VespaDeployment):
         path: str,
         body: Union[BytesIO, MultipartEncoder] = BytesIO(),
         headers: dict = {},
+        request_timeout: Optional[float] = None,
     ) -> Union[dict, httpx.Response]:
         if self.control_plane_auth_method == "access_token":
-            return self._request_with_access_token(method, path, body, headers)
+            return self._request_with_access_token(
+                method, path, body, headers, request_timeout=request_timeout
+            )
         elif self.control_plane_auth_method == "api_key":
-            return self._request_with_api_key(method, path, body, headers)
+            return self._request_with_api_key(
+                method, path, body, headers, request_timeout=request_timeout
+            )
         else:
             raise ValueError(
                 "Control plane auth method not inferred. Should be either api_key or access_token."
@@ -1297,6 +1356,7 @@ class VespaCloud(VespaDeployment):
         body: Union[BytesIO, MultipartEncoder] = BytesIO(),
         headers: dict = {},
         return_raw_response: bool = False,
+        request_timeout: Optional[float] = None,
     ) -> Union[dict, httpx.Response]:
         digest = hashes.Hash(hashes.SHA256(), default_backend())
 
@@ -1339,7 +1399,7 @@ class VespaCloud(VespaDeployment):
         }
 
         response = self.get_connection_response_with_retry(
-            method, path, body_data, headers
+            method, path, body_data, headers, request_timeout=request_timeout
         )
         return self._handle_response(response, return_raw_response, path)
 
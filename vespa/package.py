@@ -13,11 +13,36 @@ from pathlib import Path
 from shutil import copyfile
 from typing import Dict, List, Literal, Optional, Tuple, TypedDict, Union
 
+from functools import lru_cache
+
 from jinja2 import Environment, PackageLoader, select_autoescape
 from vespa.configuration.vt import Xml, vt
 from vespa.configuration.services import services
 from vespa.configuration.services import *
 
+
+@lru_cache(maxsize=1)
+def _get_template_environment() -> Environment:
+    """Shared Jinja2 environment for rendering application package templates.
+
+    The configuration is identical for every template and building the
+    environment (and its package loader) per render is wasteful, so it is
+    created once. The environment is only read from, which makes sharing safe,
+    and it also caches compiled templates across renders.
+    """
+    env = Environment(
+        loader=PackageLoader("vespa", "templates"),
+        autoescape=select_autoescape(
+            disabled_extensions=("txt",),
+            default_for_string=True,
+            default=True,
+        ),
+    )
+    env.trim_blocks = True
+    env.lstrip_blocks = True
+    return env
+
+
 if sys.version_info >= (3, 11):
     from typing import Unpack
 else:
@@ -1481,16 +1506,7 @@ class Schema(object):
 
     @property
     def schema_to_text(self) -> str:
-        env = Environment(
-            loader=PackageLoader("vespa", "templates"),
-            autoescape=select_autoescape(
-                disabled_extensions=("txt",),
-                default_for_string=True,
-                default=True,
-            ),
-        )
-        env.trim_blocks = True
-        env.lstrip_blocks = True
+        env = _get_template_environment()
         schema_template = env.get_template("schema.txt")
         return schema_template.render(
             schema_name=self.name,
@@ -2725,31 +2741,13 @@ class ApplicationPackage(object):
 
     @property
     def query_profile_to_text(self):
-        env = Environment(
-            loader=PackageLoader("vespa", "templates"),
-            autoescape=select_autoescape(
-                disabled_extensions=("txt",),
-                default_for_string=True,
-                default=True,
-            ),
-        )
-        env.trim_blocks = True
-        env.lstrip_blocks = True
+        env = _get_template_environment()
         query_profile_template = env.get_template("query_profile.xml")
         return query_profile_template.render(query_profile=self.query_profile)
 
     @property
     def query_profile_type_to_text(self):
-        env = Environment(
-            loader=PackageLoader("vespa", "templates"),
-            autoescape=select_autoescape(
-                disabled_extensions=("txt",),
-                default_for_string=True,
-                default=True,
-            ),
-        )
-        env.trim_blocks = True
-        env.lstrip_blocks = True
+        env = _get_template_environment()
         query_profile_type_template = env.get_template("query_profile_type.xml")
         return query_profile_type_template.render(
             query_profile_type=self.query_profile_type
@@ -2777,16 +2775,7 @@ class ApplicationPackage(object):
         if self.services_config:
             return str(self.services_config)
         else:
-            env = Environment(
-                loader=PackageLoader("vespa", "templates"),
-                autoescape=select_autoescape(
-                    disabled_extensions=("txt",),
-                    default_for_string=True,
-                    default=True,
-                ),
-            )
-            env.trim_blocks = True
-            env.lstrip_blocks = True
+            env = _get_template_environment()
             services_template = env.get_template("services.xml")
             return services_template.render(
                 application_name=self.name,
@@ -2800,31 +2789,13 @@ class ApplicationPackage(object):
 
     @property
     def validations_to_text(self):
-        env = Environment(
-            loader=PackageLoader("vespa", "templates"),
-            autoescape=select_autoescape(
-                disabled_extensions=("txt",),
-                default_for_string=True,
-                default=True,
-            ),
-        )
-        env.trim_blocks = True
-        env.lstrip_blocks = True
+        env = _get_template_environment()
         validations_template = env.get_template("validation-overrides.xml")
         return validations_template.render(validations=self.validations)
 
     @property
     def deployment_to_text(self):
-        env = Environment(
-            loader=PackageLoader("vespa", "templates"),
-            autoescape=select_autoescape(
-                disabled_extensions=("txt",),
-                default_for_string=True,
-                default=True,
-            ),
-        )
-        env.trim_blocks = True
-        env.lstrip_blocks = True
+        env = _get_template_environment()
         deployment_template = env.get_template("deployment.xml")
         return deployment_template.render(deployment_config=self.deployment_config)
 